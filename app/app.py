@@ -18,18 +18,17 @@ Instructions to run the code:
 Instructions to use the app:
 
 1. Upload a ZIP file containing resistograph data and nodes.
-2. Adjust the filter and visualization settings in the sidebar.
+2. Adjust the filter and visualization settings in the sidebar and press Apply.
 3. Select which columns you want to display using `st.pills`.
 4. Enable/disable scale and graph options.
 
 """
 
 import streamlit as st
+import hashlib
 import zipfile
-import tempfile
-import shutil
 import os
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import io
 import streamlit.components.v1 as components
 
@@ -52,31 +51,77 @@ st.title("Resistograph Data Visualization")
 # Sidebar nastavení
 # ---------------------------
 def sidebar_settings():
-    st.sidebar.header("Filter settings")
-    window_length = st.sidebar.number_input("Window length", min_value=3, value=201, step=2)
-    polyorder = st.sidebar.number_input("Polyorder", min_value=1, value=3, step=1)
-    upper_limit = st.sidebar.number_input("Upper limit (mm)", min_value=0, value=250, step=10)
-
-    st.sidebar.header("Visualization settings")
-    min_val = st.sidebar.number_input("Min", value=100, step=10)
-    max_val = st.sidebar.number_input("Max", value=200, step=10)
-    step = st.sidebar.number_input("Step", value=300, step=10)
-    linewidth = st.sidebar.number_input("Line width", value=20, step=1)
-    cmap = st.sidebar.selectbox("Colormap", ["gray", "viridis", "plasma", "inferno", "magma", "cividis"])
-    scale_length = st.sidebar.number_input("Scale length (mm)", value=250, step=10)
-
-    st.sidebar.header("Options")
-    show_scale = st.sidebar.checkbox("Show scale", value=True)
-    show_graphs = st.sidebar.checkbox("Show graphs along paths", value=True)
-
-    st.sidebar.header("Parameters for graphs along the path")
-    yshift = st.sidebar.number_input("yshift", min_value=0, max_value=1000, value=100)
-    yscale = st.sidebar.number_input("yscale (zoom out factor)", min_value=1, max_value=1000, value=20)
+    # Widgets inside the form do not rerun the script on every change, the
+    # settings are applied together with the button.
+    with st.sidebar.form("settings"):
+        st.header("Filter settings")
+        window_length = st.number_input("Window length", min_value=3, value=201, step=2)
+        polyorder = st.number_input("Polyorder", min_value=1, value=3, step=1)
+        upper_limit = st.number_input("Upper limit (mm)", min_value=0, value=250, step=10)
+
+        st.header("Visualization settings")
+        min_val = st.number_input("Min", value=100, step=10)
+        max_val = st.number_input("Max", value=200, step=10)
+        step = st.number_input("Step", value=300, step=10)
+        linewidth = st.number_input("Line width", value=20, step=1)
+        cmap = st.selectbox("Colormap", ["gray", "viridis", "plasma", "inferno", "magma", "cividis"])
+        scale_length = st.number_input("Scale length (mm)", value=250, step=10)
+
+        st.header("Options")
+        show_scale = st.checkbox("Show scale", value=True)
+        show_graphs = st.checkbox("Show graphs along paths", value=True)
+
+        st.header("Parameters for graphs along the path")
+        yshift = st.number_input("yshift", min_value=0, max_value=1000, value=100)
+        yscale = st.number_input("yscale (zoom out factor)", min_value=1, max_value=1000, value=20)
+
+        st.form_submit_button("Apply")
 
     return (window_length, polyorder, upper_limit, min_val, max_val, step,
             linewidth, cmap, scale_length, show_scale, show_graphs, yshift, yscale)
 
 
+# ---------------------------
+# Načítání dat
+# ---------------------------
+def zip_digest(zip_bytes):
+    return hashlib.blake2b(zip_bytes, digest_size=16).hexdigest()
+
+
+# The bytes and their hash are kept in the session state, so the archive is
+# copied and hashed once per upload and not on every rerun.
+def uploaded_zip(uploaded_file):
+    if st.session_state.get("zip_file_id") != uploaded_file.file_id:
+        zip_bytes = uploaded_file.getvalue()
+        st.session_state["zip_bytes"] = zip_bytes
+        st.session_state["zip_hash"] = zip_digest(zip_bytes)
+        st.session_state["zip_file_id"] = uploaded_file.file_id
+    return st.session_state["zip_bytes"], st.session_state["zip_hash"]
+
+
+# Filtered data are reused across reruns, so the Savitzky-Golay filter is
+# applied only when the archive or the filter settings change. The files
+# are read straight from the uploaded bytes, nothing is written to disk.
+# Arguments starting with an underscore are not hashed by Streamlit, the
+# hash of the archive is the cache key. The caches are shared by all
+# sessions, so only a few recent archives and settings are kept.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_read(zip_hash, _zip_bytes, window_length, polyorder, upper_limit):
+    with zipfile.ZipFile(io.BytesIO(_zip_bytes)) as archive:
+        return read_resistograph_data(
+            archive,
+            upper_limit=upper_limit,
+            window_length=window_length,
+            polyorder=polyorder
+        )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_read_nodes(zip_hash, _zip_bytes):
+    with zipfile.ZipFile(io.BytesIO(_zip_bytes)) as archive:
+        return read_nodes(archive)
+
+
 # ---------------------------
 # Funkce na vykreslení
 # ---------------------------
@@ -84,7 +129,14 @@ def plot_resistograph(resistograph_df, nodes_df, settings, selected_cols_bars, s
     (window_length, polyorder, upper_limit, min_val, max_val, step, linewidth, cmap,
      scale_length, show_scale, show_graphs, yshift, yscale) = settings
 
-    fig, [ax, cax] = plt.subplots(1, 2, figsize=(8, 6), gridspec_kw={'width_ratios': [40, 1]})
+    # Figure is used directly instead of pyplot, the app does not need the
+    # global figure manager and nothing has to be closed after rendering.
+    # The colorbar axes is created only when there are colored bars.
+    fig = Figure(figsize=(8, 6))
+    if selected_cols_bars:
+        ax, cax = fig.subplots(1, 2, gridspec_kw={'width_ratios': [40, 1]})
+    else:
+        ax = fig.subplots()
     ax.plot(nodes_df['x'], nodes_df['y'], 'o')
 
     if selected_cols_bars:
@@ -93,12 +145,14 @@ def plot_resistograph(resistograph_df, nodes_df, settings, selected_cols_bars, s
             min=min_val, max=max_val, step=step, linewidth=linewidth,
             cmap=cmap
         )
-    else:
-        cax.axis('off')
 
     if show_graphs and selected_cols_graphs:
+        # The graphs are drawn from every sample, but no graph can show more
+        # points than about twice the figure width in pixels.
+        target = int(fig.dpi * fig.get_figwidth() * 2)
+        stride = max(1, len(resistograph_df) // target)
         add_resistograph_graphs(
-            resistograph_df[selected_cols_graphs], nodes_df, ax,
+            resistograph_df[selected_cols_graphs].iloc[::stride], nodes_df, ax,
             yshift=yshift, yscale=yscale
         )
 
@@ -108,18 +162,30 @@ def plot_resistograph(resistograph_df, nodes_df, settings, selected_cols_bars, s
 
     ax.axis('off')
     ax.set_aspect(1)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
+# The data frames are fully determined by the archive hash and the filter
+# settings, so they are excluded from the cache key. The cache is shared by
+# all sessions, only the most recent images are kept.
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_png(zip_hash, _resistograph_df, _nodes_df, settings, selected_cols_bars, selected_cols_graphs):
+    fig = plot_resistograph(_resistograph_df, _nodes_df, settings, selected_cols_bars, selected_cols_graphs)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    return buf.getvalue()
+
+
 # ---------------------------
 # Generátor Jupyter kódu
 # ---------------------------
-def generate_notebook_code(settings, selected_cols_bars, selected_cols_graphs):
-    (window_length, polyorder, upper_limit, min_val, max_val, step, linewidth, cmap,
-     scale_length, show_scale, show_graphs, yshift, yscale) = settings
+# Names of the values returned by sidebar_settings, in the same order.
+SETTINGS_FIELDS = ("window_length", "polyorder", "upper_limit", "min_val", "max_val", "step",
+                   "linewidth", "cmap", "scale_length", "show_scale", "show_graphs", "yshift", "yscale")
 
-    notebook_code = f"""
+# The template is built once at import, each call only fills in the values.
+NOTEBOOK_TEMPLATE = """
 import zipfile
 import tempfile
 import shutil
@@ -196,7 +262,14 @@ plt.show()
 
 shutil.rmtree(temp_dir)
 """
-    return notebook_code
+
+
+def generate_notebook_code(settings, selected_cols_bars, selected_cols_graphs):
+    return NOTEBOOK_TEMPLATE.format_map(dict(
+        zip(SETTINGS_FIELDS, settings),
+        selected_cols_bars=selected_cols_bars,
+        selected_cols_graphs=selected_cols_graphs,
+    ))
 
 
 # ---------------------------
@@ -233,24 +306,13 @@ def make_pills(all_items, key="A"):
 with tab1:
     uploaded_file = st.file_uploader("Upload ZIP file with data", type="zip")
     if uploaded_file:
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, "data.zip")
-        with open(zip_path, "wb") as f:
-            f.write(uploaded_file.read())
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-        data_dir = temp_dir + "/"
+        zip_bytes, zip_hash = uploaded_zip(uploaded_file)
 
         (window_length, polyorder, upper_limit, min_val, max_val, step, linewidth, cmap,
          scale_length, show_scale, show_graphs, yshift, yscale) = settings
 
-        resistograph_df = read_resistograph_data(
-            data_dir,
-            upper_limit=upper_limit,
-            window_length=window_length,
-            polyorder=polyorder
-        )
-        nodes_df = read_nodes(data_dir)
+        resistograph_df = _cached_read(zip_hash, zip_bytes, window_length, polyorder, upper_limit)
+        nodes_df = _cached_read_nodes(zip_hash, zip_bytes)
 
         all_cols = list(resistograph_df.columns)
         st.subheader("Select columns for colored bars")
@@ -262,14 +324,8 @@ with tab1:
             make_pills(all_cols, key="B")
             selected_cols_graphs = st.session_state.get("selected_items_B", all_cols)   
 
-        fig = plot_resistograph(resistograph_df, nodes_df, settings, selected_cols_bars, selected_cols_graphs)
-
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
-        plt.close(fig)
-        st.image(buf.getvalue())
-
-        shutil.rmtree(temp_dir)
+        st.image(render_png(zip_hash, resistograph_df, nodes_df, settings,
+                            selected_cols_bars, selected_cols_graphs))
 
 with tab2:
     notebook_code = generate_notebook_code(settings, selected_cols_bars, selected_cols_graphs)
@@ -13,12 +13,19 @@ Configuration and validation are handled via Pydantic models.
 #%%
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import glob
-from scipy.signal import savgol_filter
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.polynomial.polynomial import polyvander
 import logging
-from matplotlib.collections import LineCollection
-from matplotlib.transforms import Affine2D
+# matplotlib and scipy.signal take most of the import time, they are
+# imported in the functions which use them, so reading the data does not
+# load the plotting libraries.
 
 # --- NEW: importy pro konfiguraci ---
 from pydantic import BaseModel, Field, PositiveInt, DirectoryPath, model_validator
@@ -81,19 +88,24 @@ def read_nodes(data_dir):
 
     Parameters:
     ----------
-    data_dir : str
-        Directory containing the nodes CSV file.
+    data_dir : str or zipfile.ZipFile
+        Directory or opened ZIP archive containing the nodes CSV file.
 
     Returns:
     -------
     pd.DataFrame
         DataFrame containing the nodes with centered coordinates.
     """
-    if not data_dir.endswith('/'):
-        data_dir += '/'
-    path = f"{data_dir}nodes.csv"
-    logging.info(f"Reading nodes from {path}")
-    nodes = pd.read_csv(path, header=None)
+    if isinstance(data_dir, zipfile.ZipFile):
+        logging.info(f"Reading nodes from {data_dir.filename}")
+        with data_dir.open("nodes.csv") as f:
+            nodes = pd.read_csv(f, header=None)
+    else:
+        if not data_dir.endswith('/'):
+            data_dir += '/'
+        path = f"{data_dir}nodes.csv"
+        logging.info(f"Reading nodes from {path}")
+        nodes = pd.read_csv(path, header=None)
     nodes -= nodes.mean(axis=0)
     nodes.columns = ['x', 'y']
     nodes.index = nodes.index + 1
@@ -101,7 +113,7 @@ def read_nodes(data_dir):
     return nodes
 
 
-def read_resistograph_file(filepath):
+def read_resistograph_file(filepath, opener=None):
     """ Read a resistograph data file and extract the data section.
     The method assumes the data starts after a line containing '[DATA]'.
     It returns a DataFrame with the resistograph data.
@@ -110,6 +122,9 @@ def read_resistograph_file(filepath):
     ----------
     filepath : str
         Path to the resistograph data file.
+    opener : callable, optional
+        Function returning a binary file object for `filepath`, for example
+        `zipfile.ZipFile.open`. By default the file is opened by `open`.
 
     Returns:
     -------
@@ -117,47 +132,225 @@ def read_resistograph_file(filepath):
         DataFrame containing the resistograph data.
     """
     logging.info(f"Reading resistograph data from {filepath}")
-    df = pd.read_csv(filepath, header=None)
-    header_idx = np.argmax(df.iloc[:, 0] == '[DATA]')
-    return df.iloc[header_idx + 1:].reset_index(drop=True).astype(float)
+    if opener is None:
+        opener = partial(open, mode='rb')
+    # The file is read once, the marker is found by a byte search and only
+    # the data section is parsed by the C engine directly into float32, the
+    # values need no more precision and the arrays are half the size.
+    with opener(filepath) as f:
+        buf = f.read()
+    marker = buf.find(b'[DATA]')
+    if marker < 0:
+        raise ValueError(f"No [DATA] section found in {filepath}")
+    line_end = buf.find(b'\n', marker)
+    data = buf[line_end + 1:] if line_end >= 0 else b''
+    return pd.read_csv(io.BytesIO(data), header=None, dtype=np.float32)
+
+
+@lru_cache(maxsize=32)
+def savgol_kernels(window_length, polyorder):
+    """ Compute the Savitzky-Golay coefficients for the interior and for the edges.
+    The rows of the hat matrix of the least squares polynomial fit evaluate the
+    fitted polynomial at the window points, which is what the 'interp' mode of
+    `scipy.signal.savgol_filter` uses for the first and the last half window.
+    The result is cached for each pair of parameters and the returned arrays
+    are read-only.
 
+    Parameters:
+    ----------
+    window_length : int
+        Window length for Savitzky-Golay filter.
+    polyorder : int
+        Polynomial order for Savitzky-Golay filter.
+
+    Returns:
+    -------
+    tuple of np.ndarray
+        Convolution coefficients for the interior points and two matrices
+        giving the filtered values of the first and the last half window.
+    """
+    half = window_length // 2
+    center = (window_length - 1) / 2
+    vander = polyvander((np.arange(window_length) - center) / window_length, polyorder)
+    fit = np.linalg.pinv(vander)
+    hat = vander @ fit
+    kernels = fit[0][::-1], hat[:half], hat[window_length - half:]
+    for kernel in kernels:
+        kernel.flags.writeable = False
+    return kernels
+
+
+# The kernels for the default filter settings are computed at import.
+savgol_kernels(201, 3)
+
+
+def savgol_smooth(data, window_length, polyorder):
+    """ Apply Savitzky-Golay filter along the first axis of a 2D array.
+    The result is the same as from `savgol_filter(data, window_length, polyorder,
+    axis=0, mode='interp')`, but the interior is computed by a single FFT based
+    convolution. Values whose window contains NaN are NaN.
+
+    Parameters:
+    ----------
+    data : np.ndarray
+        2D array with one signal in each column.
+    window_length : int
+        Window length for Savitzky-Golay filter.
+    polyorder : int
+        Polynomial order for Savitzky-Golay filter.
+
+    Returns:
+    -------
+    np.ndarray
+        Filtered data with the same shape and dtype as `data`.
+    """
+    from scipy.signal import oaconvolve
+    n = data.shape[0]
+    if polyorder >= window_length:
+        raise ValueError("polyorder must be less than window_length.")
+    if window_length > n:
+        raise ValueError("window_length must be less than or equal to the size of the data.")
+    half = window_length // 2
+    coeffs, edge_start, edge_end = (k.astype(data.dtype) for k in savgol_kernels(window_length, polyorder))
+
+    # FFT would spread NaNs over the whole column, they are replaced by zeros
+    # and only the values whose window contains NaN are set back to NaN.
+    nan = np.isnan(data)
+    has_nan = nan.any()
+    filled = np.where(nan, 0, data) if has_nan else data
+    out = oaconvolve(filled, coeffs[:, None], mode='full', axes=0)[half:half + n]
+    if has_nan:
+        nan_count = np.concatenate([np.zeros((1, data.shape[1]), dtype=int), np.cumsum(nan, axis=0)])
+        rows = np.arange(n)
+        start = np.clip(rows - half, 0, n)
+        end = np.clip(rows - half + window_length, 0, n)
+        out[nan_count[end] - nan_count[start] > 0] = np.nan
+
+    out[:half] = edge_start @ data[:window_length]
+    out[n - half:] = edge_end @ data[n - window_length:]
+    return out
+
+
+def _data_cache_path(cache_dir, data_dir, filepaths, *settings):
+    """ Path of the cache file for the filtered data.
+    The name is a hash of the settings and of the modification time and size
+    of each file (CRC and size for the members of a ZIP archive), so any
+    change of the data gives a new cache file.
+    """
+    if isinstance(data_dir, zipfile.ZipFile):
+        stamps = [(name, data_dir.getinfo(name).CRC, data_dir.getinfo(name).file_size)
+                  for name in filepaths]
+    else:
+        stamps = [(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+                  for path in filepaths for stat in [os.stat(path)]]
+    digest = hashlib.blake2b(repr((stamps, settings)).encode(), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, f"resistograph_{digest}.npz")
 
-def read_resistograph_data(data_dir, upper_limit=0, window_length=201, polyorder=3):
+
+def read_resistograph_data(data_dir, upper_limit=0, window_length=201, polyorder=3, cache_dir=None):
     """ Read resistograph data from files in the specified directory.
     The method reads all files with the extension `.dpa` and extracts the data section.
     The processed data is stored in a pandas DataFrame.
 
     Parameters:
     ----------
-    data_dir : str
-        Directory containing resistograph data files.
+    data_dir : str or zipfile.ZipFile
+        Directory or opened ZIP archive containing resistograph data files.
+        The files are read from the top level of the archive without
+        extracting them.
     upper_limit : int
         Ignore the data deeper than this limit.
     window_length : int
         Window length for Savitzky-Golay filter.
     polyorder : int
         Polynomial order for Savitzky-Golay filter.
+    cache_dir : str, optional
+        Directory for caching the filtered data. If given, the result is
+        stored there as `.npz` and later calls with unchanged files and
+        settings load it instead of reading and filtering the files.
 
     Returns:
     -------
     pd.DataFrame
         DataFrame containing processed resistograph data.
     """
-    if not data_dir.endswith('/'):
-        data_dir += '/'
-    filepaths = sorted(glob.glob(f"{data_dir}*.dpa"))
-    data_frames = {i: read_resistograph_file(fp) for i, fp in enumerate(filepaths)}
-    df = pd.concat(data_frames, axis=1)
-    df.columns = [i[0] + 1 for i in df.columns]
-    df.index = df.index / 100
-    df.index.name = "depth/mm"
-    df.columns.name = "position"
-    df = df.loc[:upper_limit]
-    return df.apply(lambda col: savgol_filter(col, window_length, polyorder))
+    if isinstance(data_dir, zipfile.ZipFile):
+        opener = data_dir.open
+        filepaths = sorted(name for name in data_dir.namelist()
+                           if name.endswith('.dpa') and '/' not in name)
+    else:
+        opener = None
+        if not data_dir.endswith('/'):
+            data_dir += '/'
+        # Hidden files are skipped, as glob does for '*.dpa'.
+        with os.scandir(data_dir) as entries:
+            filepaths = sorted(entry.path for entry in entries
+                               if entry.name.endswith('.dpa') and not entry.name.startswith('.')
+                               and entry.is_file())
+    if not filepaths:
+        raise ValueError(f"No .dpa files found in {data_dir}")
+
+    if cache_dir is not None:
+        cache_path = _data_cache_path(cache_dir, data_dir, filepaths, upper_limit, window_length, polyorder)
+        if os.path.exists(cache_path):
+            logging.info(f"Loading filtered data from {cache_path}")
+            try:
+                with np.load(cache_path) as cached:
+                    return _resistograph_frame(cached['data'])
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as error:
+                # A broken cache file is removed and the data are recomputed.
+                logging.warning(f"Ignoring unreadable cache file {cache_path}: {error}")
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+
+    # The C parser releases the GIL, so the files are parsed in parallel.
+    workers = max(1, min(len(filepaths), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        frames = executor.map(read_resistograph_file, filepaths, [opener] * len(filepaths))
+        traces = [frame.iloc[:, 0].to_numpy() for frame in frames]
+
+    # The traces are copied into one preallocated array, only down to the
+    # upper limit (samples are 1/100 mm apart). Shorter traces are padded
+    # with NaN. Single precision is plenty for resistograph values and
+    # halves the memory traffic of the filter below.
+    n_rows = min(max(len(trace) for trace in traces), max(0, int(np.floor(upper_limit * 100)) + 1))
+    data = np.full((n_rows, len(traces)), np.nan, dtype=np.float32, order='F')
+    for i, trace in enumerate(traces):
+        trace = trace[:n_rows]
+        data[:len(trace), i] = trace
+
+    # One call filters all columns, the filter coefficients are computed once.
+    filtered = savgol_smooth(data, window_length, polyorder)
+
+    if cache_dir is not None:
+        # Written to a unique temporary file first, so neither an interrupted
+        # run nor concurrent writers leave a broken cache behind.
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+            try:
+                np.savez(f, data=filtered)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+        os.replace(f.name, cache_path)
+    return _resistograph_frame(filtered)
+
+
+def _resistograph_frame(filtered):
+    """ Wrap the filtered data into a DataFrame indexed by depth and position. """
+    index = pd.Index(np.arange(filtered.shape[0]) / 100, name="depth/mm")
+    columns = pd.Index(np.arange(1, filtered.shape[1] + 1), name="position")
+    return pd.DataFrame(filtered, index=index, columns=columns)
 
 
 # === Plotting Functions ===
 
+# Colors of the scale ticks along the paths, red and black alternately.
+_TICK_RGBA = np.array([[1, 0, 0, 1], [0, 0, 0, 1]], dtype=np.float32)
+
 def add_resistograph_data(df, nodes, ax, cax, min=100, max=200, step=300, linewidth=20, cmap='gray'):
     """ Add resistograph data to the plot.
 
@@ -176,7 +369,8 @@ def add_resistograph_data(df, nodes, ax, cax, min=100, max=200, step=300, linewi
     max : int
         Maximum value for the color map.
     step : int
-        Step for downsampling the data for visualization.
+        Step for downsampling the data for visualization. Each segment is
+        colored by the maximum of the `step` values it covers.
     linewidth : int
         Line width for the resistograph lines.
 
@@ -185,30 +379,60 @@ def add_resistograph_data(df, nodes, ax, cax, min=100, max=200, step=300, linewi
     matplotlib.axes.Axes
         The axes with the resistograph data added.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
     logging.info(f"Adding resistograph data to the plot with {len(df.columns)} columns.")
     cmap = plt.get_cmap(cmap)
     norm = plt.Normalize(min, max)
 
-    for pos in df.columns:
-        drill_pos = get_drilling_start(pos, nodes)['coordinates']
-        values = df[pos].values
-        direction = -drill_pos / np.linalg.norm(drill_pos)
-
-        depth = np.arange(len(values)) / 100000
-        x, y = (depth.reshape(-1,1) * direction + drill_pos).T
-        mask = ~np.isnan(values)
-        x, y, values = x[mask], y[mask], np.clip(values[mask], min, max)
-
-        segments = np.column_stack([x, y]).reshape(-1, 1, 2)[::step]
-        segments = np.concatenate([segments[:-1], segments[1:]], axis=1)
-
-        lc = LineCollection(segments, cmap=cmap, norm=norm, linewidth=linewidth)
-        lc.set_array(values[::step])
+    # The geometry of all columns is computed at once and the segments are
+    # drawn by a single LineCollection, so matplotlib handles one artist
+    # instead of one per column.
+    coordinates, _ = get_drilling_starts(nodes, df.columns)
+    coordinates = coordinates.astype(np.float32)
+    directions = -coordinates / np.sqrt((coordinates * coordinates).sum(axis=1, keepdims=True))
+    # Only every step-th sample is a segment end, so the data are
+    # downsampled before any coordinates are computed. Rows of `data` are
+    # the columns.
+    full = df.to_numpy(dtype=np.float32)
+    data = full[::step].T
+    depth = np.arange(data.shape[1], dtype=np.float32) * np.float32(step / 100000)
+    points = depth[None, :, None] * directions[:, None, :] + coordinates[:, None, :]
+
+    # Written without max(..., 0), the builtin is shadowed by the `max` parameter.
+    n_segments = data.shape[1] - 1 if data.shape[1] else 0
+    # Consecutive points are paired through a strided view, the segments
+    # are copied only once, when flattened for the LineCollection.
+    if n_segments:
+        segments = sliding_window_view(points, 2, axis=1).swapaxes(-1, -2).reshape(-1, 2, 2)
+    else:
+        segments = np.empty((0, 2, 2), dtype=np.float32)
+    # Each segment spans `step` samples and is colored by their maximum,
+    # so narrow peaks are not lost between the segment ends.
+    pooled = full[:n_segments * step].reshape(n_segments, step, full.shape[1]).max(axis=1).T
+    segment_values = pooled.reshape(-1)
+
+    # The smoothed data usually contain no NaN, then no mask is needed.
+    # Otherwise the segments touching a missing value are not drawn.
+    nan = np.isnan(pooled) | np.isnan(data[:, 1:])
+    if nan.any():
+        valid = ~nan.reshape(-1)
+        segments, segment_values = segments[valid], segment_values[valid]
+    segment_values = np.clip(segment_values, min, max)
+
+    if len(segments):
+        # Rasterized, so vector outputs (PDF, SVG) embed the dense bars as
+        # a single image instead of thousands of paths. The wide segments
+        # touch each other, antialiasing and projecting caps only cost time.
+        # The colors are mapped once here and not on every draw, the
+        # colorbar below has its own ScalarMappable.
+        lc = LineCollection(segments, colors=cmap(norm(segment_values)), linewidth=linewidth,
+                            rasterized=True, antialiased=False, capstyle='butt')
         ax.add_collection(lc)
 
     ax.axis('off')
     sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-    plt.colorbar(sm, cax=cax)
+    cax.figure.colorbar(sm, cax=cax)
     return ax
 
 def add_scale(ax):
@@ -225,6 +449,7 @@ def add_scale(ax):
     matplotlib.axes.Axes
         The axes with the scale added.
     """
+    from matplotlib.collections import LineCollection
     x0, x1 = ax.get_xlim()
     y0, y1 = ax.get_ylim()
     scale_segments = np.array([
@@ -262,6 +487,48 @@ def get_drilling_start(i, nodes_df):
     return {'coordinates': np.array([ox, oy]), 'angle': angle}
 
 
+def get_drilling_starts(nodes_df, positions):
+    """
+    Get the starting points and angles of the drilling for several positions.
+    All drilling starts are computed at once from the node coordinates, which
+    is much faster than calling `get_drilling_start` for each position.
+
+    Parameters
+    ----------
+    nodes_df : pd.DataFrame
+        DataFrame containing node information.
+    positions : array-like
+        Indices of the drilling positions.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Coordinates of the drilling starts with shape (len(positions), 2)
+        and the angles of the drilling in degrees.
+    """
+    xy = nodes_df[['x', 'y']].to_numpy(dtype=np.float64)
+    starts, angles = _drilling_geometry(xy.tobytes(), len(xy))
+    indexer = nodes_df.index.get_indexer(positions)
+    if (indexer < 0).any():
+        missing = [pos for pos, i in zip(positions, indexer) if i < 0]
+        raise KeyError(f"Drilling positions {missing} are not in the nodes")
+    return starts[indexer], angles[indexer]
+
+
+@lru_cache(maxsize=16)
+def _drilling_geometry(xy_bytes, n_nodes):
+    """ Drilling starts and angles for all nodes, cached by the node coordinates.
+    The geometry does not depend on the data or on the plot settings, so it
+    is computed once for each set of nodes. The arrays are read-only.
+    """
+    xy = np.frombuffer(xy_bytes, dtype=np.float64).reshape(n_nodes, 2)
+    starts = 0.5 * (xy + np.roll(xy, -1, axis=0))
+    angles = np.degrees(np.arctan2(-starts[:, 1], -starts[:, 0]))
+    starts.flags.writeable = False
+    angles.flags.writeable = False
+    return starts, angles
+
+
 def add_resistograph_graphs(resistograph_df, nodes_df, ax, yshift=100, yscale=20, color='C0'):
     """
     Add resistograph graphs to the plot.
@@ -284,6 +551,7 @@ def add_resistograph_graphs(resistograph_df, nodes_df, ax, yshift=100, yscale=20
     matplotlib.axes.Axes
         The axes with the resistograph graphs added.
     """
+    from matplotlib.collections import LineCollection, PolyCollection
     resistograph_df = (
         (resistograph_df.index / 1000)
         .to_series()
@@ -293,14 +561,26 @@ def add_resistograph_graphs(resistograph_df, nodes_df, ax, yshift=100, yscale=20
     resistograph_df = resistograph_df.div(resistograph_df.max()).div(yscale)
     u = resistograph_df.index.values
 
-    for i in resistograph_df.columns:
-        driling_start = get_drilling_start(i, nodes_df)
-        T = Affine2D().rotate_deg(driling_start['angle']).translate(*driling_start['coordinates'])
-        v = resistograph_df[i].values
-        trans = T + ax.transData
-        ax.plot(u, v, transform=trans, color=color)
-        ax.fill_between(u, v, 0, where=v >= 0, transform=trans,
-                        alpha=0.4, zorder=1000, color=color)
+    # The graphs are rotated to the drilling paths in NumPy and all of them
+    # are drawn by one LineCollection (curves) and one PolyCollection (fills).
+    lines, fills = [], []
+    coordinates, angles = get_drilling_starts(nodes_df, resistograph_df.columns)
+    data = resistograph_df.to_numpy()
+    for j, ((ox, oy), angle) in enumerate(zip(coordinates, np.radians(angles))):
+        c, s = np.cos(angle), np.sin(angle)
+        v = data[:, j]
+        curve = np.column_stack([u * c - v * s + ox, u * s + v * c + oy])
+        baseline = np.column_stack([u * c + ox, u * s + oy])
+        # Split the graph into the runs of valid values, as plot and
+        # fill_between with where=v >= 0 do.
+        valid = np.concatenate([[False], v >= 0, [False]])
+        bounds = np.flatnonzero(valid[1:] != valid[:-1]).reshape(-1, 2)
+        for start, end in bounds:
+            lines.append(curve[start:end])
+            fills.append(np.concatenate([curve[start:end], baseline[start:end][::-1]]))
+
+    ax.add_collection(LineCollection(lines, color=color))
+    ax.add_collection(PolyCollection(fills, alpha=0.4, zorder=1000, color=color))
     return ax
 
 
@@ -324,8 +604,9 @@ def add_scale_along_path(ax, drill_pos, scale_length=250, scale_step=50):
         matplotlib.axes.Axes
             The axes with the scale added.
     """
+    from matplotlib.collections import LineCollection
     # Scale visualization
-    direction = -drill_pos / np.linalg.norm(drill_pos)
+    direction = -drill_pos / np.hypot(*drill_pos)
 
     tick_positions = np.arange(scale_length + 1, step=scale_step) / 1000
     xred = tick_positions * direction[0] + drill_pos[0]
@@ -333,7 +614,7 @@ def add_scale_along_path(ax, drill_pos, scale_length=250, scale_step=50):
 
     tick_segments = np.column_stack([xred, yred]).reshape(-1, 1, 2)
     tick_segments = np.concatenate([tick_segments[:-1], tick_segments[1:]], axis=1)
-    tick_colors = ['red' if i % 2 == 0 else 'black' for i in range(len(xred))]
+    tick_colors = _TICK_RGBA[np.arange(len(tick_segments)) % 2]
 
     lc_ticks = LineCollection(tick_segments, colors=tick_colors, linewidth=4)
     ax.add_collection(lc_ticks) 
@@ -360,10 +641,20 @@ def add_all_scales_along_path(ax, drill_positions, nodes_df, scale_length=250):
     matplotlib.axes.Axes
         The axes with the scale bars added.
     """
-    for drill_pos in drill_positions:
-        drill_coordinates = get_drilling_start(drill_pos, nodes_df)
-        add_scale_along_path(ax, drill_coordinates['coordinates'], scale_length)     
-    return ax   
+    from matplotlib.collections import LineCollection
+    # The ticks of all scales are computed at once and drawn as one collection,
+    # the result is the same as from `add_scale_along_path` for each position.
+    coordinates, _ = get_drilling_starts(nodes_df, drill_positions)
+    directions = -coordinates / np.sqrt((coordinates * coordinates).sum(axis=1, keepdims=True))
+
+    tick_positions = np.arange(scale_length + 1, step=50) / 1000
+    points = tick_positions[None, :, None] * directions[:, None, :] + coordinates[:, None, :]
+    tick_segments = np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+    tick_colors = _TICK_RGBA[np.arange(len(tick_positions) - 1) % 2]
+
+    lc_ticks = LineCollection(tick_segments, colors=np.tile(tick_colors, (len(coordinates), 1)), linewidth=4)
+    ax.add_collection(lc_ticks)
+    return ax
 
 
 # %%
@@ -390,6 +681,8 @@ def main(
     color: str = "C0",
     data_dir: str = "data/",
     scale_length: int = 250,
+    cache_dir: Optional[str] = typer.Option(
+        None, help="Directory for caching the filtered data between runs"),
 ):
     """ Main function to visualize resistograph data on a tomogram.
     It reads the resistograph data and nodes, processes the data, and plots it.
@@ -416,8 +709,11 @@ def main(
         cols_graphs = [1,2,3,4,5,6,7,8,9,10,11,12],
         )    
 
+    import matplotlib.pyplot as plt
+
     fig, [ax, cax] = plt.subplots(1, 2, figsize=(8, 6), gridspec_kw={'width_ratios': [40, 1]})
-    resistograph_df = read_resistograph_data(str(config.data_dir), **config.filter.model_dump())
+    resistograph_df = read_resistograph_data(str(config.data_dir), **config.filter.model_dump(),
+                                             cache_dir=cache_dir)
     nodes_df = read_nodes(str(config.data_dir))
 
     ax.plot(nodes_df['x'], nodes_df['y'], 'o')
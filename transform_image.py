@@ -67,22 +67,26 @@ def transform_image(overlay, ax, A_img, B_img, A_target, B_target, alpha=1, zord
     v_img = B_img - A_img
     v_target = B_target - A_target
 
-    # Rotation
-    angle_img = np.arctan2(v_img[1], v_img[0])
-    angle_target = np.arctan2(v_target[1], v_target[0])
-    rotation_angle = angle_target - angle_img
-
     # Scaling
-    scale = np.linalg.norm(v_target) / np.linalg.norm(v_img)
+    norm_img = np.hypot(*v_img)
+    norm_target = np.hypot(*v_target)
+    scale = norm_target / norm_img
+
+    # Rotation from v_img to v_target, its cosine and sine follow from the
+    # dot and cross products, no angles are needed
+    c = (v_img[0] * v_target[0] + v_img[1] * v_target[1]) / (norm_img * norm_target)
+    s = (v_img[0] * v_target[1] - v_img[1] * v_target[0]) / (norm_img * norm_target)
 
-    # Transfomation
-    trans = (
-        Affine2D()
-        .translate(-A_img[0], -A_img[1])     # 1. shift A_img to (0, 0)
-        .rotate(rotation_angle)              # 2. rotate
-        .scale(-scale, scale)                # 3. scale
-        .translate(*A_target)                # 4. shift to final position
-    )
+    # Transfomation: shift A_img to (0, 0), rotate, scale (mirrored in x)
+    # and shift to A_target, composed into a single matrix
+    linear = np.array([[-scale * c, scale * s],
+                       [scale * s, scale * c]])
+    shift = A_target - linear @ A_img
+    trans = Affine2D(np.array([
+        [linear[0, 0], linear[0, 1], shift[0]],
+        [linear[1, 0], linear[1, 1], shift[1]],
+        [0, 0, 1]
+    ]))
 
     if plot_image:
         # draw the picture